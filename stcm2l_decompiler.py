@@ -20,8 +20,28 @@ import os
 import sys
 import struct
 import re
+import bisect
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count, islice
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import AbstractSet, List, Tuple, Optional
+
+# Binary field readers - unpack_from() reads in place without slicing self.data
+_DIALOGUE_FILE_HEADER = struct.Struct('<II')  # Dialogue format file header: entry_count (4) + type (4)
+_DIALOGUE_ENTRY_HEADER = struct.Struct('<HH')  # Dialogue format entry header: type (2) + index (2)
+_FULL_ENTRY_HEADER = struct.Struct('<III')  # Full format entry header: type (4) + index (4) + size (4)
+
+# str.isascii() is O(1) on CPython but only exists on Python 3.7+; on 3.6 the ASCII fast path is skipped
+_STR_ISASCII = getattr(str, 'isascii', None)
+
+
+def _encode_output(parts: List[str]) -> bytes:
+    """Join output lines and encode them as a UTF-8 text-mode file would (platform newlines)."""
+    text = ''.join(parts)
+    if os.linesep != '\n':
+        text = text.replace('\n', os.linesep)
+    return text.encode('utf-8')
 
 
 class STCM2LDecompiler:
@@ -46,22 +66,116 @@ class STCM2LDecompiler:
         r'^@[a-zA-Z0-9_]+$',   # @ prefixed single words
     ]
 
+    # Pre-compiled regexes (compiled once at class load instead of per call)
+    # BYTECODE_PATTERNS joined into one alternation so is_bytecode() does a single match
+    _BYTECODE_RE = re.compile('|'.join(f'(?:{p})' for p in BYTECODE_PATTERNS), re.IGNORECASE)
+    _TERMINAL_PUNCT_RE = re.compile(r'[。！？\.!?\"』）\]…]')
+    _LOWERCASE_START_RE = re.compile(r'^[a-z(「『（]')
+    # Bytecode-looking word: @ command, very short word, or alphanumeric code
+    _WORD_BYTECODE_RE = re.compile(r'^(?:@.*|[a-z]{1,3}|[a-z]+\d+)$')
+    _VOWEL_REP_RE = re.compile(r'^[あいうえお]+$')
+    _PUNCT_ONLY_RE = re.compile(r'^[。！？]+$')
+    _TERMINAL_END_RE = re.compile(r'[。！』）」]$')
+    # Sentence-ending punctuation (. ! ? 。 ！ ／) checked on the last character; ellipses don't count
+    _TERMINAL_SET = frozenset('.!?\u3002\uff01\uff0f')
+    _ELLIPSIS_SUFFIXES = ('...', '。。。')
+    _JP_RE = re.compile(r'[\u3000-\u9fff]')  # Japanese punctuation, kana and kanji
+    _ASCII_ALPHA_RE = re.compile(r'[A-Za-z]')
+    # Dialogue format entry header candidate: type byte 1-100, 0x00, index byte 1-255, 0x00.
+    # Zero-width lookahead so finditer() reports every (overlapping) offset
+    _DIALOGUE_HEADER_RE = re.compile(rb'(?=[\x01-\x64]\x00[\x01-\xff]\x00)')
+    # Dialogue format text segment: run of 2+ bytes that are neither null nor 0xFF padding
+    _TEXT_SEGMENT_RE = re.compile(rb'[^\x00\xff]{2,}')
+    # Dialogue format segments that are bytecode instructions / labels, not text
+    _SKIPPED_SEGMENTS = frozenset({'memory_init', 'memory_exit', 'COLLECTION_LINK', 'scene_play', 'suma'})
+    # Common speaker prefixes that follow a dialogue format entry header: 'yougo', 'her01', etc.
+    _DIALOGUE_SPEAKER_PREFIXES = frozenset({
+        b'yougo', b'her01', b'zara0', b'ness0', b'pear0',
+        b'rich0', b'rath0', b'elza0', b'tiara'
+    })
+    # Bytecode/variable patterns rejected by _is_valid_text() (using word boundaries to avoid partial matches)
+    VALID_TEXT_BYTECODE_PATTERNS = [
+        r'\bRelease_', r'\bRute_count_', r'\bFav[A-Z]', r'\bLH_sel_', r'\bsure\d+',  # v1.1.20: Fixed to require digit after 'sure'
+        r'\bsuma\b', r'\bmemory_', r'\bCOLLECTION_LINK', r'\bEXPORT_DATA', r'\bswitch',
+        r'\bscene_play', r'\brathL', r'\belzaL', r'\bzara0', r'\bness0', r'\bher\d+',
+        r'\bzk\d+', r'\bbg\d+',  # Bytecode variable patterns
+        r'\b[A-Z][a-z]+_(bad|good)_end\b',  # Rath_bad_end, Arles_good_end, etc.
+        r'\bTrueEnd\b',  # Route endings
+        r'^[A-Z][a-z]+_[A-Za-z_]+$',  # Pattern like "Bad_PandR", "FavPearl" (full match)
+        # Effect codes and UI elements (v1.0.3)
+        r'\bef_[a-z0-9_]+\b',  # Effect codes (ef_shake5, ef_flash, etc.)
+        r'\bselect\b',  # UI button text
+        r'\bexport_data\b',  # Export markers (case insensitive)
+        # Character variable patterns (v1.1.2)
+        r'^[a-z]+\d+[a-z]*_[a-z]+$',  # raths01ht_kana, mejo07_kamae (lowercase+digits+optional letters+underscore)
+        r'^[a-z]+\d+$',  # mejo07, rath02, etc. (lowercase with numbers, without underscore)
+        r'^[a-z]{3,5}$',  # Short bytecode identifiers (cck, suma, etc.)
+    ]
+    # Joined into one alternation so _is_valid_text() does a single search
+    _VALID_TEXT_BYTECODE_RE = re.compile('|'.join(f'(?:{p})' for p in VALID_TEXT_BYTECODE_PATTERNS), re.IGNORECASE)
+    _KANA_KANJI_RE = re.compile(r'[\u3040-\u9fff]')  # Japanese kana and kanji (no CJK punctuation)
+    # str.translate() table deleting control characters except \n, \r, \t
+    _CONTROL_CHARS_DELETE = dict.fromkeys(c for c in range(32) if chr(c) not in '\n\r\t')
+    # Three ASCII letters anywhere - search() stops at the third instead of collecting every letter
+    _ASCII_ALPHA3_RE = re.compile(r'[A-Za-z][^A-Za-z]*[A-Za-z][^A-Za-z]*[A-Za-z]')
+
     # Full character names that act as speaker labels (from Type 0x02 entries)
     # These should NOT be filtered - they indicate speaker changes
-    SPEAKER_NAMES = {
+    # Frozen: the lookup sets below are derived from it once at class creation
+    SPEAKER_NAMES = frozenset({
         # English names (case-insensitive)
         'pearl', 'richie', 'nesso', 'zara', 'edgar', 'elza', 'rath',
         'guillan', 'arles', 'henrietta',
         # Katakana names (Japanese)
         'パール', 'リッチー', 'ネッソ', 'ザラ', 'エドガー', 'エルザ', 'ラス',
         'ギラン', 'アルル', 'ヘンリエッタ'
-    }
+    })
+    # Lengths of all speaker names - texts of any other length can't be a speaker name.
+    # Checked before .lower(): the only character that grows when lowercased is U+0130
+    # (it becomes 'i' + U+0307), and no speaker name contains U+0307
+    _SPEAKER_NAME_LENGTHS = frozenset(len(name) for name in SPEAKER_NAMES)
+    _SPEAKER_NAME_MAX_LEN = max(_SPEAKER_NAME_LENGTHS)
+    # Lowercased copy for lookups
+    _SPEAKER_NAMES_LOWER = frozenset(name.lower() for name in SPEAKER_NAMES)
+
+    # v1.1.13: Known English UI choice words (from Type 0x01 entries) - never bytecode
+    _ENGLISH_CHOICE_WORDS = frozenset({'yes', 'no', 'ok', 'cancel', 'accept', 'decline', 'close'})
+
+    # Entry type groups for combine_dialogue_entries() (frozensets: O(1) membership, no per-test tuple scan)
+    _SPEAKER_CARRIER_TYPES = frozenset({0x02, 0x03})  # Speaker names / bytecode indicators
+    # Types that continue a speaker's dialogue (no 0x07 - handled separately)
+    _SPEAKER_DIALOGUE_TYPES = frozenset({0x01, 0x03, 0x04, 0x05, 0x06, 0x08, 0x09, 0x0A, 0x0B, 0x0C, 0x0D, 0x0E, 0x0F, 0x10, 0x11})
+    # Dialogue/narration types that are combined with following entries
+    _DIALOGUE_TYPES = frozenset({0x04, 0x05, 0x06, 0x07, 0x08, 0x09, 0x0A, 0x0B, 0x0C, 0x0D, 0x0E, 0x0F, 0x10, 0x11})
+    _COMBINE_TYPES = _DIALOGUE_TYPES | {0x01, 0x03}  # Types that may follow dialogue
+    _TYPE07_COMBINE_TYPES = frozenset({0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x09, 0x0A, 0x0B, 0x0C, 0x0D, 0x0E})
+    _TYPE07_STOP_TYPES = frozenset({0x04, 0x05, 0x06, 0x07, 0x0D, 0x0E, 0x12})  # End the 0x07 speaker look-back
+    # Unclosed quote: continuation types are always taken, tail types only if they contain a quote
+    _QUOTE_CLOSURE_TYPES = frozenset({0x08, 0x0A, 0x0C, 0x0D})
+    _QUOTE_CLOSURE_TAIL_TYPES = frozenset({0x03, 0x04, 0x06, 0x0F})
+
+    # Entry types accepted by the full-format parsers
+    _PADDED_ENTRY_TYPES = frozenset({0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x09, 0x0A, 0x0B, 0x0C, 0x0F, 0x10, 0x11, 0x12})
+    _PADDED_NEXT_ENTRY_TYPES = frozenset({0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x09, 0x0A, 0x0B, 0x0C, 0x0D, 0x0E, 0x10, 0x11})
+    _COMPACT_ENTRY_TYPES = frozenset(range(0x01, 0x13))  # 0x01-0x12
+    _COMPACT_TYPE_RE = re.compile(rb'[\x01-\x12]\x00\x00\x00')  # Little-endian uint32 type 0x01-0x12
+    _NULL_RUN_RE = re.compile(rb'\x00*')
+    _PADDING_RUN_RE = re.compile(rb'[\x00\xff]+')  # Null/0xFF padding between legacy strings
 
     def __init__(self, filepath: str):
         self.filepath = filepath
         self.filename = os.path.basename(filepath)
         self.data = None
         self.entries = []
+        # Per-file memo of is_bytecode() results - scripts repeat the same short strings a lot
+        self._bytecode_cache = {}
+        # Per-file memo of _lang_flags() results: text -> (has_japanese, alpha_count)
+        self._lang_cache = {}
+        # Per-file memo of is_speaker_name() results - the same few names label most lines
+        self._speaker_cache = {}
+        # Sequential display numbers used by write_output()
+        self._entry_counter = count(1)
+        self._display_index = count(1)
 
     def read_file(self) -> bool:
         """Read the binary file."""
@@ -78,14 +192,17 @@ class STCM2LDecompiler:
         if not self.data:
             return "unknown"
 
+        # Slice the header once for both checks
+        header = self.data[:6]
+
         # Check for full STCM2L header format
-        if self.data[:6] == b'STCM2L':
+        if header == b'STCM2L':
             return "full"
 
         # Check for dialogue format (starts with entry count)
         if len(self.data) >= 8:
             # First 4 bytes might be entry count
-            entry_count = struct.unpack('<I', self.data[:4])[0]
+            entry_count = int.from_bytes(header[:4], 'little')
             if entry_count < 10000:  # Reasonable entry count
                 return "dialogue"
 
@@ -93,47 +210,93 @@ class STCM2LDecompiler:
 
     def is_bytecode(self, text: str) -> bool:
         """Check if text matches a bytecode pattern that should be filtered out."""
+        result = self._bytecode_cache.get(text)
+        if result is None:
+            result = self._bytecode_cache[text] = self._check_bytecode(text)
+        return result
+
+    def _check_bytecode(self, text: str) -> bool:
+        """Uncached is_bytecode() check."""
         text = text.strip()
 
         # v1.1.13: Known English UI choice words are NOT bytecode (from Type 0x01 entries)
-        ENGLISH_CHOICE_WORDS = {'yes', 'no', 'ok', 'cancel', 'accept', 'decline', 'close'}
-        if text.lower() in ENGLISH_CHOICE_WORDS:
+        if text.lower() in self._ENGLISH_CHOICE_WORDS:
             return False
 
         # Check against known bytecode patterns
-        for pattern in self.BYTECODE_PATTERNS:
-            if re.match(pattern, text, re.IGNORECASE):
-                return True
+        if self._BYTECODE_RE.match(text):
+            return True
 
         # Check for bytecode-heavy content (many @ symbols, short character sequences)
         # Split text into words and check if majority look like bytecode
         words = text.split()
-        if len(words) > 5:
-            bytecode_count = 0
-            for word in words:
-                # Count words that look like bytecode
-                if (word.startswith('@') or
-                    re.match(r'^[a-z]{1,3}$', word) or  # very short words
-                    re.match(r'^[a-z]+\d+$', word) or   # alphanumeric codes
-                    len(word) < 3):
-                    bytecode_count += 1
+        word_count = len(words)
+        if word_count > 5:
             # v1.1.10: Increased threshold from 60% to 85% to avoid false positives on English dialogue
             # Normal English with short words ("to", "for", "had") was being misidentified as bytecode
-            if bytecode_count / len(words) > 0.85:
-                return True
+            # (bytecode_count / word_count > 0.85, kept in integers: bytecode_count * 20 > word_count * 17)
+            limit = word_count * 17
+            match_word = self._WORD_BYTECODE_RE.match
+            bytecode_count = 0
+            for k, word in enumerate(words):
+                # Count words that look like bytecode (@ commands, very short words, alphanumeric codes)
+                if len(word) < 3 or match_word(word):
+                    bytecode_count += 1
+                    if bytecode_count * 20 > limit:
+                        return True
+                elif (bytecode_count + word_count - k - 1) * 20 <= limit:
+                    # Threshold can no longer be reached
+                    break
 
         return False
 
     def is_name_indicator(self, text: str) -> bool:
         """Check if text is a #Name[X] character indicator (KEEP these in output)."""
-        return bool(re.match(r'^#Name\[[0-9]+\]$', text.strip()))
+        # Plain string checks instead of a regex: '#Name[' + ASCII digits + ']'
+        text = text.strip()
+        if not (text.startswith('#Name[') and text.endswith(']')):
+            return False
+        digits = text[6:-1]
+        return bool(digits) and not digits.strip('0123456789')
 
     def is_speaker_name(self, text: str) -> bool:
         """Check if text is a character name (speaker label from Type 0x02 entries)."""
+        result = self._speaker_cache.get(text)
+        if result is None:
+            result = self._speaker_cache[text] = self._check_speaker_name(text)
+        return result
+
+    def _check_speaker_name(self, text: str) -> bool:
+        """Uncached is_speaker_name() check."""
         # Strip whitespace AND null bytes (binary padding)
         text = text.strip().strip('\x00')
-        text = text.lower()
-        return text in self.SPEAKER_NAMES
+        if len(text) not in self._SPEAKER_NAME_LENGTHS:
+            return False
+        return text.lower() in self._SPEAKER_NAMES_LOWER
+
+    def _lang_flags(self, text: str) -> Tuple[bool, int]:
+        """Return (has Japanese characters, alphabetic character count) for text, cached per text."""
+        flags = self._lang_cache.get(text)
+        if flags is None:
+            # Pure ASCII text can't contain Japanese - skip the regex scan
+            is_ascii = _STR_ISASCII is not None and _STR_ISASCII(text)
+            flags = self._lang_cache[text] = (
+                not is_ascii and self._JP_RE.search(text) is not None,
+                sum(map(str.isalpha, text))
+            )
+        return flags
+
+    def _has_japanese(self, text: str) -> bool:
+        """Check if text contains Japanese characters (U+3000-U+9FFF)."""
+        return self._lang_flags(text)[0]
+
+    def _has_alpha_over(self, text: str, threshold: int) -> bool:
+        """Check if text has more than `threshold` alphabetic characters (any script, like str.isalpha), stopping early."""
+        return next(islice(filter(str.isalpha, text), threshold, None), None) is not None
+
+    def _has_ascii_english(self, text: str) -> bool:
+        """Check if text has more than 2 ASCII letters."""
+        return self._ASCII_ALPHA3_RE.search(text) is not None
 
     def should_combine_entries(self, prev_entry: dict, curr_entry: dict) -> bool:
         """Check if current entry continues previous dialogue."""
@@ -151,10 +314,12 @@ class STCM2LDecompiler:
             return False
 
         # Check for language mixing - don't combine Japanese with English or vice versa
-        prev_has_japanese = any('\u3000' <= c <= '\u9fff' for c in prev_text)
-        prev_has_english = sum(1 for c in prev_text if c.isalpha()) > 2
-        curr_has_japanese = any('\u3000' <= c <= '\u9fff' for c in curr_text)
-        curr_has_english = sum(1 for c in curr_text if c.isalpha()) > 2
+        # prev_text is often the growing combined text of a look-ahead, so it is checked
+        # directly instead of through _lang_flags() (which would cache every intermediate string)
+        prev_has_japanese = self._JP_RE.search(prev_text) is not None
+        prev_has_english = self._has_alpha_over(prev_text, 2)
+        curr_has_japanese, curr_alpha_count = self._lang_flags(curr_text)
+        curr_has_english = curr_alpha_count > 2
 
         # v1.1.16: Don't combine if current text has both Japanese AND significant English (romaji)
         # This catches cases like "痛い……！" where romaji makes it look like English
@@ -172,13 +337,13 @@ class STCM2LDecompiler:
         # 1. Previous ends without terminal punctuation (and is reasonably long)
         # v1.0.3: Added \] to treat closing bracket as terminal punctuation
         # v1.1.15: Added … (horizontal ellipsis U+2026) to terminal punctuation
-        if len(prev_text) > 3 and not re.search(r'[。！？\.!?\"』）\]…]', prev_text):
+        if len(prev_text) > 3 and not self._TERMINAL_PUNCT_RE.search(prev_text):
             # Allow combination if current entry continues the thought
             # (even if it starts with capital - might be proper noun or continuation)
             return True
 
         # 2. Current starts with lowercase or continuation marker
-        if re.match(r'^[a-z(「『（]', curr_text):
+        if self._LOWERCASE_START_RE.match(curr_text):
             return True
 
         # 3. Parenthetical continuation - prev has open paren without close
@@ -214,21 +379,20 @@ class STCM2LDecompiler:
         if text_len < 2 or text_len > 10:
             return False
 
+        has_japanese = self._has_japanese(text)
+
         # v1.1.13: Type 0x02 entries with short English text are choice options (from Type 0x01)
         # But only recognize known English UI choice words, not any short English text
         if entry_type == 0x02:
-            has_japanese = any('\u3000' <= c <= '\u9fff' for c in text)
             if not has_japanese:
                 # Only known English choice words are choice candidates
-                ENGLISH_CHOICE_WORDS = {'yes', 'no', 'ok', 'cancel', 'accept', 'decline', 'close'}
-                if text.lower() in ENGLISH_CHOICE_WORDS:
+                if text.lower() in self._ENGLISH_CHOICE_WORDS:
                     return True
                 else:
                     # Other Type 0x02 without Japanese are NOT choice candidates (e.g., "ed")
                     return False
 
         # Must contain Japanese characters (for regular Japanese choices)
-        has_japanese = any('\u3000' <= c <= '\u9fff' for c in text)
         if not has_japanese:
             return False
 
@@ -246,13 +410,13 @@ class STCM2LDecompiler:
 
         # Exclude same-vowel repetitions (meaningless sounds like あああ, いいい)
         # But not valid words like いいえ (no) or ええ (yes)
-        if len(text) >= 2 and len(set(text)) == 1 and re.match(r'^[あいうえお]+$', text):
+        if len(text) >= 2 and len(set(text)) == 1 and self._VOWEL_REP_RE.match(text):
             return False
-        if re.match(r'^[。！？]+$', text):
+        if self._PUNCT_ONLY_RE.match(text):
             return False
 
         # Exclude entries with terminal punctuation (dialogue)
-        if re.search(r'[。！』）」]$', text):
+        if self._TERMINAL_END_RE.search(text):
             return False
 
         return True
@@ -270,36 +434,35 @@ class STCM2LDecompiler:
         Returns modified entries list with grouped choices.
         """
         # Find all choice candidates
-        choice_candidates = []
-        for entry in entries:
-            if self.is_choice_candidate(entry):
-                choice_candidates.append(entry)
+        is_choice_candidate = self.is_choice_candidate
+        choice_candidates = [entry for entry in entries if is_choice_candidate(entry)]
 
         if not choice_candidates:
             return entries
 
         # Group related choices (within 50 index positions)
+        # Candidates from decompile_full_format() are already in index order, so the end of
+        # each 50-position window can be found with a binary search instead of a linear walk
+        indices = [e.get('index', 0) for e in choice_candidates]
+        candidate_count = len(choice_candidates)
+        in_index_order = indices == sorted(indices)
+
         grouped = []
+        grouped_ids = set()  # id() of candidates merged into a grouped entry
         i = 0
-        while i < len(choice_candidates):
-            current = choice_candidates[i]
-            current_index = current.get('index', 0)
-            current_text = current.get('text', '').strip()
-
-            # Start a new group
-            group = [current]
-            j = i + 1
+        while i < candidate_count:
+            current_index = indices[i]
 
             # Find nearby choices (within 50 index positions)
-            while j < len(choice_candidates):
-                next_choice = choice_candidates[j]
-                next_index = next_choice.get('index', 0)
-
-                if next_index - current_index <= 50:
-                    group.append(next_choice)
+            if in_index_order:
+                j = bisect.bisect_right(indices, current_index + 50, i + 1)
+            else:
+                j = i + 1
+                while j < candidate_count and indices[j] - current_index <= 50:
                     j += 1
-                else:
-                    break
+
+            # Start a new group
+            group = choice_candidates[i:j]
 
             # Only create combined entry if group has 2-5 options
             if 2 <= len(group) <= 5:
@@ -307,8 +470,7 @@ class STCM2LDecompiler:
                 combined_text = ' / '.join(choice_texts)
 
                 # Mark entries for removal
-                for e in group:
-                    e['_remove'] = True
+                grouped_ids.update(map(id, group))
 
                 # Create combined choice entry
                 combined_entry = {
@@ -325,40 +487,160 @@ class STCM2LDecompiler:
 
             i = j if j > i + 1 else i + 1
 
-        # Remove marked entries and add grouped ones
-        result = [e for e in entries if not e.get('_remove', False)]
-        result.extend(grouped)
+        # Remove marked entries and merge in grouped ones by index.
+        # Entries are normally already in index order, and so are the grouped entries, so a
+        # single merge walk replaces re-sorting everything. Ties keep the original entry first,
+        # same as the stable sort did. Out-of-order input falls back to the sort.
+        result = []
+        k = 0
+        grouped_count = len(grouped)
+        prev_index = None
+        for e in entries:
+            entry_index = e.get('index', 0)
+            if prev_index is not None and entry_index < prev_index:
+                break
+            prev_index = entry_index
+            while k < grouped_count and grouped[k]['index'] < entry_index:
+                result.append(grouped[k])
+                k += 1
+            if id(e) not in grouped_ids:
+                result.append(e)
+        else:
+            result.extend(grouped[k:])
+            return result
 
-        # Sort by index
+        result = [e for e in entries if id(e) not in grouped_ids]
+        result.extend(grouped)
         result.sort(key=lambda e: e.get('index', 0))
 
         return result
 
+    def _annotate(self, entries: List[dict]):
+        """
+        Pre-compute per-entry text features once, before combining.
+
+        The combining passes look at the same entry several times (main loop,
+        look-ahead, look-back, quote closure), so the flags are cached on the
+        entry dict under underscore keys:
+        _jp, _en, _alpha, _ascii_en, _bc, _name_ind, _speaker_name, _stripped_len, _starts_dquote_dash,
+        _quotes, _ends_punct
+        """
+        # Bind methods to locals once - avoids attribute lookups per entry
+        lang_flags = self._lang_flags
+        has_ascii_english = self._has_ascii_english
+        is_bytecode = self.is_bytecode
+        is_name_indicator = self.is_name_indicator
+        is_speaker_name = self.is_speaker_name
+        ends_with_terminal = self._ends_with_terminal_punct
+        for e in entries:
+            text = e.get('text', '')
+            stripped = text.strip()
+            e['_jp'], alpha_count = lang_flags(text)
+            e['_en'] = alpha_count > 2
+            e['_alpha'] = alpha_count
+            e['_ascii_en'] = has_ascii_english(text)
+            e['_bc'] = is_bytecode(text)
+            e['_name_ind'] = is_name_indicator(text)
+            e['_speaker_name'] = is_speaker_name(text)
+            e['_stripped_len'] = len(stripped)
+            e['_starts_dquote_dash'] = stripped.startswith('"--')
+            e['_quotes'] = text.count('"')
+            e['_ends_punct'] = ends_with_terminal(text.rstrip())
+
+    def _ends_with_terminal_punct(self, stripped: str) -> bool:
+        """Check if (right-stripped) text ends with terminal punctuation (. ! ? 。 ！ ／), but NOT ellipsis (... 。。。)."""
+        return stripped[-1:] in self._TERMINAL_SET and not stripped.endswith(self._ELLIPSIS_SUFFIXES)
+
+    def _join_parts(self, parts: List[str]) -> str:
+        """Join text parts, adding a space between parts unless the text so far is empty or ends with ' '/newline."""
+        # Collect pieces and join once instead of repeated string concatenation;
+        # last_char tracks the end of the text so far
+        pieces = [parts[0]]
+        last_char = parts[0][-1:]
+        for part in parts[1:]:
+            if last_char not in ('', ' ', '\n'):
+                pieces.append(' ')
+                last_char = ' '
+            pieces.append(part)
+            if part:
+                last_char = part[-1]
+        return ''.join(pieces)
+
+    def _last_line_starts_with_quote(self, parts: List[str]) -> bool:
+        """Check if the last line of ' '.join(parts) starts with '"', without joining."""
+        for part in reversed(parts):
+            newline_pos = part.rfind('\n')
+            if newline_pos >= 0:
+                return part.startswith('"', newline_pos + 1)
+        return bool(parts) and parts[0].startswith('"')
+
     def combine_dialogue_entries(self, entries: List[dict]) -> List[dict]:
         """Combine split dialogue entries and filter out bytecode, with speaker separation."""
+        self._annotate(entries)
+        # Bind methods used inside the loops to locals once
+        has_alpha_over = self._has_alpha_over
+        jp_search = self._JP_RE.search
+        ascii_alpha_findall = self._ASCII_ALPHA_RE.findall
+        should_combine = self.should_combine_entries
+        last_line_starts_with_quote = self._last_line_starts_with_quote
+        join_parts = self._join_parts
+        speaker_carrier_types = self._SPEAKER_CARRIER_TYPES
+        speaker_dialogue_types = self._SPEAKER_DIALOGUE_TYPES
+        dialogue_types = self._DIALOGUE_TYPES
+        combine_types = self._COMBINE_TYPES
+        type07_combine_types = self._TYPE07_COMBINE_TYPES
+        quote_closure_types = self._QUOTE_CLOSURE_TYPES
+        quote_closure_tail_types = self._QUOTE_CLOSURE_TAIL_TYPES
         combined = []
+        entry_count = len(entries)
+        # Parallel lists of the fields the loops read most, instead of repeated dict.get() calls
+        types = [e.get('type', 0) for e in entries]
+        texts = [e.get('text', '') for e in entries]
+        indices = [e.get('index', 0) for e in entries]
+
+        # #Name[X] indicator that applies to each entry: the first indicator after the most recent
+        # dialogue entry. One forward pass instead of a backward scan per dialogue entry.
+        # v1.1.14: Stop at any previous dialogue entry (not just Type 0x04) - this prevents looking
+        # too far back across multiple dialogues; Type 0x02 speakers and other entries in between
+        # are passed over, so indicators that come before speaker entries are still found
+        name_indicators = []
+        pending_indicator = None
+        for k in range(entry_count):
+            name_indicators.append(pending_indicator)
+            if entries[k]['_name_ind']:
+                if pending_indicator is None:
+                    pending_indicator = texts[k]
+            elif types[k] in dialogue_types:  # v1.1.25: Added 0x0F
+                pending_indicator = None
         i = 0
-        while i < len(entries):
+        while i < entry_count:
             current = entries[i]
-            current_text = current.get('text', '')
-            current_type = current.get('type', 0)
+            current_text = texts[i]
+            current_type = types[i]
+            current_index = current.get('index')
 
             # Handle Type 0x02 and 0x03 entries (speaker names / bytecode indicators)
             # v1.1.6: Both Type 0x02 and 0x03 can contain speaker names
             # Binary format: Type 0x02 speaker → ONE OR MORE dialogue entries → Type 0x02 speaker
             # Combine consecutive dialogues after speaker until next speaker or terminal punctuation
-            if current_type in (0x02, 0x03):
+            if current_type in speaker_carrier_types:
                 # Check if this is a speaker name
-                if self.is_speaker_name(current_text):
+                if current['_speaker_name']:
                     # This is a speaker name - look ahead for consecutive dialogue entries
-                    speaker = current_text
+                    # (interned: the same few names label most lines of a script)
+                    speaker = sys.intern(current_text)
                     i += 1
 
                     dialogue_parts = []
-                    while i < len(entries):
+                    quote_count = 0  # Running count of '"' in dialogue_parts
+                    last_part_ends_punct = False  # _ends_punct of the entry behind dialogue_parts[-1]
+                    # Language flags of ' '.join(dialogue_parts), kept up to date as parts are added
+                    parts_have_japanese = False
+                    parts_alpha_count = 0
+                    while i < entry_count:
                         next_entry = entries[i]
-                        next_type = next_entry.get('type', 0)
-                        next_text = next_entry.get('text', '')
+                        next_type = types[i]
+                        next_text = texts[i]
 
                         # v1.1.10: Combine Type 0x04, 0x05, 0x06, 0x08, 0x09, 0x0A, 0x0B, 0x0C, 0x0D, 0x0E dialogue entries (exclude 0x07, 0x0F, 0x12 narration)
                         # v1.1.20: Removed 0x07 from combine list - Type 0x07 has separate logic to detect dialogue vs narration
@@ -369,16 +651,16 @@ class STCM2LDecompiler:
                         # v1.1.18: Added 0x10 to combine list - Type 0x10 is dialogue continuation type
                         # v1.1.19: Added 0x11 to combine list - Type 0x11 is dialogue continuation type
                         # v1.1.25: Added 0x0C to combine list - Type 0x0C dialogue with speaker should combine
-                        if next_type not in (0x01, 0x03, 0x04, 0x05, 0x06, 0x08, 0x09, 0x0A, 0x0B, 0x0C, 0x0D, 0x0E, 0x0F, 0x10, 0x11):
+                        if next_type not in speaker_dialogue_types:
                             break
 
                         # Stop at #Name[X] indicators (speaker change)
-                        if self.is_name_indicator(next_text):
+                        if next_entry['_name_ind']:
                             break
 
                         # v1.1.26: Stop combining if entry starts with "--" (structural marker for speaker change)
                         # Binary analysis shows this pattern indicates entry should NOT combine with previous speaker
-                        if next_text.strip().startswith('"--'):
+                        if next_entry['_starts_dquote_dash']:
                             break
 
                         # Stop if text ends with terminal punctuation (. ! ? 。 ！ ？)
@@ -386,43 +668,38 @@ class STCM2LDecompiler:
                         # v1.1.24: Continue combining Type 12/13 entries after terminal punctuation
                         # v1.1.25: Enhanced quote matching to look multiple entries ahead for quote closure
                         # v1.1.25: Don't treat ... (ellipsis) as terminal punctuation
-                        stripped_text = next_text.rstrip()
                         # Check if ends with terminal punctuation, but NOT ellipsis (...)
-                        ends_with_punct = (
-                            stripped_text.endswith(('.', '!', '?', '\u3002', '\uff01', '\uff0f')) and
-                            not stripped_text.endswith('...') and
-                            not stripped_text.endswith('。。。')
-                        )
-                        if ends_with_punct:
+                        if next_entry['_ends_punct']:
                             dialogue_parts.append(next_text)
+                            quote_count += next_entry['_quotes']
                             i += 1
 
                             # Check if we need to continue for quote closure (multi-entry lookahead)
-                            combined_check = ' '.join(dialogue_parts)
                             # v1.1.27: Also check if last line starts with quote (handles cases where first lines have no quotes)
-                            last_line = combined_check.split('\n')[-1] if '\n' in combined_check else combined_check
-                            if combined_check.count('"') % 2 == 1 or last_line.startswith('"'):  # Odd quotes or starts with quote
+                            if quote_count % 2 == 1 or last_line_starts_with_quote(dialogue_parts):  # Odd quotes or starts with quote
                                 # Look ahead for quote closure across multiple entries
-                                while i < len(entries):
-                                    next_type = entries[i].get('type', 0)
-                                    next_text_check = entries[i].get('text', '')
+                                while i < entry_count:
+                                    check_entry = entries[i]
+                                    next_type = types[i]
+                                    next_text_check = texts[i]
 
                                     # v1.1.27: Type 8/10 are dialogue continuation types, continue for quote closure
                                     # Type 12/13: Always continue (narration between dialogue parts)
-                                    if next_type in (0x08, 0x0A, 0x0C, 0x0D):
+                                    if next_type in quote_closure_types:
                                         dialogue_parts.append(next_text_check)
+                                        quote_count += check_entry['_quotes']
                                         i += 1
                                         continue
 
                                     # Type 4/6/3/15: Check if it closes the quote
-                                    if next_type in (0x04, 0x06, 0x03, 0x0F):
+                                    if next_type in quote_closure_tail_types:
                                         # If entry has any quotes, add it and check if quote is now closed
-                                        if next_text_check.count('"') > 0:
+                                        if check_entry['_quotes'] > 0:
                                             dialogue_parts.append(next_text_check)
+                                            quote_count += check_entry['_quotes']
                                             i += 1
                                             # Check if quote is now closed
-                                            combined_check = ' '.join(dialogue_parts)
-                                            if combined_check.count('"') % 2 == 0:
+                                            if quote_count % 2 == 0:
                                                 break  # Quote closed, stop combining
                                             # Quote still unclosed, continue to next entry
                                             continue
@@ -430,6 +707,7 @@ class STCM2LDecompiler:
                                         # Only continue if it's part of trailing speech (lowercase start, no terminal punctuation)
                                         elif next_text_check and not next_text_check[0].isupper():
                                             dialogue_parts.append(next_text_check)
+                                            quote_count += check_entry['_quotes']
                                             i += 1
                                             continue
                                         else:
@@ -442,23 +720,22 @@ class STCM2LDecompiler:
                             break  # Break if no unclosed quote or quote was closed
 
                         # Skip bytecode entries
-                        if self.is_bytecode(next_text):
+                        if next_entry['_bc']:
                             i += 1
                             continue
 
                         # v1.1.16: Check for language mixing - don't combine Japanese with English
                         # This catches cases like "痛い……！" where romaji makes it look like English
-                        next_has_japanese = any('\u3000' <= c <= '\u9fff' for c in next_text)
-                        next_has_english = sum(1 for c in next_text if c.isalpha()) > 2
+                        next_has_japanese = next_entry['_jp']
+                        next_has_english = next_entry['_en']
                         if next_has_japanese and next_has_english:
                             # Current text has both Japanese AND English (romaji) - stop combining
                             break
 
                         # v1.1.16: Check if combining with previous dialogue_parts would mix languages
                         if dialogue_parts:
-                            combined_so_far = ' '.join(dialogue_parts)
-                            combined_has_japanese = any('\u3000' <= c <= '\u9fff' for c in combined_so_far)
-                            combined_has_english = sum(1 for c in combined_so_far if c.isalpha()) > 2
+                            combined_has_japanese = parts_have_japanese
+                            combined_has_english = parts_alpha_count > 2
                             # Don't combine if language would switch
                             if (combined_has_japanese and next_has_english and not next_has_japanese):
                                 break
@@ -471,17 +748,11 @@ class STCM2LDecompiler:
                         # v1.1.25: Also skip capital letter check if there's an unclosed quote
                         # v1.1.25: Don't treat ... (ellipsis) as terminal punctuation
                         if dialogue_parts and next_text:
-                            prev_ended = dialogue_parts[-1].rstrip()
                             # Check for sentence-ending punctuation (including ASCII period), but NOT ellipsis
-                            prev_ends_punct = (
-                                prev_ended.endswith(('.', '!', '?', '\u3002', '\uff01', '\uff0f')) and
-                                not prev_ended.endswith('...') and
-                                not prev_ended.endswith('。。。')
-                            )
+                            prev_ends_punct = last_part_ends_punct
                             if prev_ends_punct:
                                 # v1.1.25: Check if combined text has unclosed quote before capital letter check
-                                combined_check = ' '.join(dialogue_parts)
-                                if combined_check.count('"') % 2 == 1:  # Odd quotes = unclosed
+                                if quote_count % 2 == 1:  # Odd quotes = unclosed
                                     # Unclosed quote, continue combining regardless of capital letter
                                     pass  # Don't break, let the combining continue
                                 elif next_text[0].isupper():
@@ -490,19 +761,19 @@ class STCM2LDecompiler:
                                         break
 
                         dialogue_parts.append(next_text)
+                        quote_count += next_entry['_quotes']
+                        last_part_ends_punct = next_entry['_ends_punct']
+                        parts_have_japanese = parts_have_japanese or next_has_japanese
+                        parts_alpha_count += next_entry['_alpha']
                         i += 1
 
                     # If we found dialogue parts, create a combined entry
                     if dialogue_parts:
                         # Join with space between parts
-                        combined_text = dialogue_parts[0]
-                        for part in dialogue_parts[1:]:
-                            if combined_text and not combined_text[-1] in (' ', '\n'):
-                                combined_text += ' '
-                            combined_text += part
+                        combined_text = join_parts(dialogue_parts)
 
                         combined.append({
-                            'index': current.get('index'),
+                            'index': current_index,
                             'text': combined_text,
                             'speaker': speaker,
                             'type': 0x04
@@ -512,12 +783,12 @@ class STCM2LDecompiler:
                 else:
                     # v1.0.4: Type 0x02/0x03 but not a speaker name - could be bytecode OR short Japanese choice options
                     # Check if it's a short Japanese word (はい, いいえ, etc.)
-                    text_len = len(current_text.strip())
-                    has_japanese = any('\u3000' <= c <= '\u9fff' for c in current_text)
-                    if text_len >= 2 and has_japanese and not self.is_bytecode(current_text):
+                    text_len = current['_stripped_len']
+                    has_japanese = current['_jp']
+                    if text_len >= 2 and has_japanese and not current['_bc']:
                         # This is a Japanese choice option or UI text - keep it
                         combined.append({
-                            'index': current.get('index'),
+                            'index': current_index,
                             'text': current_text,
                             'speaker': '',
                             'type': current_type
@@ -528,14 +799,14 @@ class STCM2LDecompiler:
                         # v1.1.14: Check if it's bytecode before skipping
                         # Type 0x03 can contain English dialogue continuation (e.g., "a Lobeira.")
                         # v1.1.14: Type 0x03 name indicators (#Name[X]) should be skipped
-                        if self.is_name_indicator(current_text):
+                        if current['_name_ind']:
                             # Name indicator - skip it (will be found by look-back logic)
                             i += 1
                             continue
-                        elif not self.is_bytecode(current_text):
+                        elif not current['_bc']:
                             # Not bytecode - keep it as dialogue text
                             combined.append({
-                                'index': current.get('index'),
+                                'index': current_index,
                                 'text': current_text,
                                 'speaker': '',
                                 'type': current_type
@@ -550,13 +821,13 @@ class STCM2LDecompiler:
             # v1.1.7: Handle Type 0x12 entries - these are narration and should NOT have speakers
             if current_type == 0x12:
                 # Skip bytecode entries
-                if self.is_bytecode(current_text):
+                if current['_bc']:
                     i += 1
                     continue
 
                 # Type 0x12 entries are narration - NO speakers, NO combining with dialogue
                 combined.append({
-                    'index': current.get('index'),
+                    'index': current_index,
                     'text': current_text,
                     'speaker': '',  # Narration has no speaker
                     'type': 0x12
@@ -571,13 +842,12 @@ class STCM2LDecompiler:
             if current_type == 0x01:
                 # v1.1.13: Only known English choice words should be converted to Type 0x02
                 # All other Type 0x01 entries (like "ed") are treated as garbage and skipped
-                ENGLISH_CHOICE_WORDS = {'yes', 'no', 'ok', 'cancel', 'accept', 'decline', 'close'}
-                if current_text.lower() not in ENGLISH_CHOICE_WORDS:
+                if current_text.lower() not in self._ENGLISH_CHOICE_WORDS:
                     i += 1
                     continue
 
                 combined.append({
-                    'index': current.get('index'),
+                    'index': current_index,
                     'text': current_text,
                     'speaker': '',  # Choice options have no speaker
                     'type': 0x02  # Convert to Type 0x02 for consistency
@@ -588,7 +858,7 @@ class STCM2LDecompiler:
             # v1.1.7: Handle Type 0x07 entries - can be dialogue OR narration continuation
             if current_type == 0x07:
                 # Skip bytecode entries
-                if self.is_bytecode(current_text):
+                if current['_bc']:
                     i += 1
                     continue
 
@@ -599,18 +869,18 @@ class STCM2LDecompiler:
                 j = i - 1
                 while j >= 0:
                     prev_entry = entries[j]
-                    prev_type = prev_entry.get('type', 0)
-                    if prev_type in (0x02, 0x03):
-                        prev_text = prev_entry.get('text', '')
-                        if self.is_speaker_name(prev_text):
+                    prev_type = types[j]
+                    if prev_type in speaker_carrier_types:
+                        prev_text = texts[j]
+                        if prev_entry['_speaker_name']:
                             # Found a speaker - this is dialogue continuation
                             has_speaker = True
-                            speaker_name = prev_text
+                            speaker_name = sys.intern(prev_text)
                             break
                         else:
                             # Type 0x02/0x03 but not a speaker name - bytecode, stop looking
                             break
-                    elif prev_type in (0x04, 0x05, 0x06, 0x07, 0x0D, 0x0E, 0x12):
+                    elif prev_type in self._TYPE07_STOP_TYPES:
                         # Another dialogue/narration entry - no speaker for this Type 0x07
                         break
                     else:
@@ -618,46 +888,45 @@ class STCM2LDecompiler:
 
                 # v1.1.11: Look ahead to combine Type 0x07 entries with same index
                 # v1.1.15: Extended to combine Type 0x07 with ALL dialogue continuation types
-                combined_text = current_text
+                parts = [current_text]
+                start_index = indices[i]  # i advances inside the loop, so read it once here
                 j = i + 1
 
-                while j < len(entries):
+                while j < entry_count:
                     next_entry = entries[j]
-                    next_type = next_entry.get('type', 0)
-                    next_text = next_entry.get('text', '')
-                    next_index = next_entry.get('index', 0)
+                    next_type = types[j]
 
                     # v1.1.15: Only combine with dialogue continuation types (0x03-0x0E except 0x12)
                     # Type 0x07 + Type 0x07 still requires same index (original behavior)
                     # But Type 0x07 + Type 0x05/0x06/etc. can combine regardless of index
-                    if next_type not in (0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x09, 0x0A, 0x0B, 0x0C, 0x0D, 0x0E):
+                    if next_type not in type07_combine_types:
                         break
 
                     # For Type 0x07 + Type 0x07, require same index (preserve original behavior)
                     # But allow combining with other types regardless of index
-                    if next_type == 0x07 and next_index != current.get('index', 0):
+                    if next_type == 0x07 and indices[j] != start_index:
                         break
 
                     # Don't cross name indicator boundaries
-                    if self.is_name_indicator(next_text):
+                    if next_entry['_name_ind']:
                         break
 
                     # Skip bytecode entries
-                    if self.is_bytecode(next_text):
+                    if next_entry['_bc']:
                         j += 1
                         continue
 
                     # Combine the text
-                    if combined_text and not combined_text[-1] in (' ', '\n'):
-                        combined_text += ' '
-                    combined_text += next_text
+                    parts.append(texts[j])
                     i += 1  # Skip this entry in the main loop
                     j += 1
 
+                combined_text = join_parts(parts)
+
                 if has_speaker:
                     # This is dialogue continuation - combine with speaker
                     combined.append({
-                        'index': current.get('index'),
+                        'index': current_index,
                         'text': combined_text,
                         'speaker': speaker_name,
                         'type': 0x07
@@ -665,7 +934,7 @@ class STCM2LDecompiler:
                 else:
                     # This is narration continuation - no speaker
                     combined.append({
-                        'index': current.get('index'),
+                        'index': current_index,
                         'text': combined_text,
                         'speaker': '',
                         'type': 0x07
@@ -679,48 +948,34 @@ class STCM2LDecompiler:
             # v1.1.18: Added 0x10 to type list
             # v1.1.19: Added 0x11 to type list
             # v1.1.25: Added 0x0F to type list (Type 0x0F consecutive entries should combine)
-            if current_type in (0x04, 0x05, 0x06, 0x07, 0x08, 0x09, 0x0A, 0x0B, 0x0C, 0x0D, 0x0E, 0x0F, 0x10, 0x11):
-                # Check for #Name[X] indicators before this dialogue
-                name_indicator = None
-                j = i - 1
-                while j >= 0:
-                    prev_entry = entries[j]
-                    prev_text = prev_entry.get('text', '')
-                    prev_type = prev_entry.get('type', 0)
-                    if self.is_name_indicator(prev_text):
-                        name_indicator = prev_text
-                        j -= 1
-                    elif prev_type in (0x04, 0x05, 0x06, 0x07, 0x08, 0x09, 0x0A, 0x0B, 0x0C, 0x0D, 0x0E, 0x0F, 0x10, 0x11):  # v1.1.25: Added 0x0F
-                        # v1.1.14: Stop at any previous dialogue entry (not just Type 0x04)
-                        # This prevents looking too far back across multiple dialogues
-                        break
-                    elif prev_type == 0x02 and not name_indicator:
-                        # v1.1.14: If no name indicator found yet, continue past Type 0x02 speakers
-                        # This allows finding name indicators that come before speaker entries
-                        j -= 1
-                    else:
-                        j -= 1
+            if current_type in dialogue_types:
+                # Check for #Name[X] indicators before this dialogue (precomputed above)
+                name_indicator = name_indicators[i]
 
                 # Skip bytecode-only dialogue
-                if self.is_bytecode(current_text):
+                if current['_bc']:
                     i += 1
                     continue
 
                 # v1.0.4: Skip entries that don't have meaningful content
                 # For Japanese text, 2 characters can be a complete word (はい, いいえ, etc.)
-                text_len = len(current_text.strip())
-                has_japanese = any('\u3000' <= c <= '\u9fff' for c in current_text)
+                text_len = current['_stripped_len']
+                has_japanese = current['_jp']
                 if text_len < 3 and not (text_len >= 2 and has_japanese):
                     i += 1
                     continue
 
                 # NEW: Look ahead to combine with next entries
                 combined_text = current_text
+                # Language flags of combined_text, updated only for the text appended since the last check
+                combined_has_japanese = False
+                combined_ascii_letters = 0
+                scanned_len = 0
                 j = i + 1
-                while j < len(entries):
+                while j < entry_count:
                     next_entry = entries[j]
-                    next_type = next_entry.get('type', 0)
-                    next_text = next_entry.get('text', '')
+                    next_type = types[j]
+                    next_text = texts[j]
 
                     # v1.1.10: Combine Type 0x04, 0x05, 0x06, 0x07, 0x08, 0x09, 0x0A, 0x0B, 0x0C dialogue entries (exclude 0x12)
                     # v1.1.13: Added 0x01 to exclude list - Type 0x01 choice options should NOT combine with dialogue
@@ -730,26 +985,30 @@ class STCM2LDecompiler:
                     # v1.1.19: Added 0x11 to combine list - Type 0x11 is dialogue continuation type
                     # v1.1.25: Added 0x0F to combine list - Type 0x0F consecutive entries should combine
                     # Type 0x0B/0x0C can be followed by Type 0x0A continuation
-                    if next_type not in (0x01, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x09, 0x0A, 0x0B, 0x0C, 0x0D, 0x0E, 0x0F, 0x10, 0x11):
+                    if next_type not in combine_types:
                         break
 
                     # Don't cross name indicator boundaries
-                    if self.is_name_indicator(next_text):
+                    if next_entry['_name_ind']:
                         break
 
                     # v1.1.10: Don't skip bytecode check for Type 0x0A dialogue entries
                     # v1.1.14: Also don't skip Type 0x03 - can be dialogue continuation (e.g., "a Lobeira.")
                     # Type 0x0A and Type 0x03 entries are valid dialogue and may have short words
-                    if next_type not in (0x03, 0x0A) and self.is_bytecode(next_text):
+                    if next_type not in (0x03, 0x0A) and next_entry['_bc']:
                         j += 1
                         continue
 
                     # Check for language mixing in the combined text + next text
                     # Don't combine if combining would mix Japanese and English
-                    combined_has_japanese = any('\u3000' <= c <= '\u9fff' for c in combined_text)
-                    combined_has_english = sum(1 for c in combined_text if c.isalpha() and ord(c) < 128) > 2
-                    next_has_japanese = any('\u3000' <= c <= '\u9fff' for c in next_text)
-                    next_has_english = sum(1 for c in next_text if c.isalpha() and ord(c) < 128) > 2
+                    if not combined_has_japanese:
+                        combined_has_japanese = jp_search(combined_text, scanned_len) is not None
+                    if combined_ascii_letters <= 2:
+                        combined_ascii_letters += len(ascii_alpha_findall(combined_text, scanned_len))
+                    scanned_len = len(combined_text)
+                    combined_has_english = combined_ascii_letters > 2
+                    next_has_japanese = next_entry['_jp']
+                    next_has_english = next_entry['_ascii_en']
 
                     # Don't combine if language switches (Japanese → English or English → Japanese)
                     if (combined_has_japanese and next_has_english and not next_has_japanese):
@@ -758,7 +1017,7 @@ class STCM2LDecompiler:
                         break
 
                     # Check if we should combine based on linguistic patterns
-                    if self.should_combine_entries({'text': combined_text}, {'text': next_text}):
+                    if should_combine({'text': combined_text}, {'text': next_text}):
                         # v1.1.7: Add space between parts if needed (same logic as Type 0x02 speaker combining)
                         if combined_text and not combined_text[-1] in (' ', '\n'):
                             combined_text += ' '
@@ -769,16 +1028,16 @@ class STCM2LDecompiler:
                         # If combined text has unclosed quote, continue looking for closing quote
                         if combined_text.count('"') % 2 == 1:
                             # Unclosed quote, check if next entry closes it
-                            if next_type in (0x08, 0x0A, 0x0C, 0x0D):
+                            if next_type in quote_closure_types:
                                 # Type 8/10/12/13 are dialogue continuation types, continue for quote closure
                                 if combined_text and not combined_text[-1] in (' ', '\n'):
                                     combined_text += ' '
                                 combined_text += next_text
                                 j += 1
                                 continue
-                            elif next_type in (0x04, 0x06, 0x03, 0x0F):
+                            elif next_type in quote_closure_tail_types:
                                 # Check if entry has closing quote
-                                if next_text.count('"') > 0:
+                                if next_entry['_quotes'] > 0:
                                     if combined_text and not combined_text[-1] in (' ', '\n'):
                                         combined_text += ' '
                                     combined_text += next_text
@@ -796,12 +1055,11 @@ class STCM2LDecompiler:
                 if name_indicator:
                     combined_text = f"{name_indicator}\n{combined_text}"
 
-                # Final check for meaningful content
-                has_japanese = any('\u3000' <= c <= '\u9fff' for c in combined_text)
-                has_english = len([c for c in combined_text if c.isalpha()]) > 3
-                if has_japanese or has_english:
+                # Final check for meaningful content (Japanese, or more than 3 letters)
+                # combined_text is usually unique, so check it directly instead of through _lang_flags()
+                if jp_search(combined_text) is not None or has_alpha_over(combined_text, 3):
                     combined.append({
-                        'index': current.get('index'),
+                        'index': current_index,
                         'text': combined_text,
                         'speaker': name_indicator if name_indicator else '',
                         'type': current_type
@@ -810,16 +1068,16 @@ class STCM2LDecompiler:
                 continue
 
             # Unknown type - use bytecode check
-            if self.is_bytecode(current_text):
+            if current['_bc']:
                 i += 1
                 continue
 
             # v1.0.4: For Japanese text, 2 characters can be a complete word (はい, うん, etc.)
-            text_len = len(current_text.strip())
-            has_japanese = any('\u3000' <= c <= '\u9fff' for c in current_text)
+            text_len = current['_stripped_len']
+            has_japanese = current['_jp']
             if text_len >= 3 or (text_len >= 2 and has_japanese):
                 combined.append({
-                    'index': current.get('index'),
+                    'index': current_index,
                     'text': current_text,
                     'speaker': '',
                     'type': current_type
@@ -836,11 +1094,10 @@ class STCM2LDecompiler:
         Decode a UTF-8 string from binary data.
         Returns (decoded_string, bytes_consumed).
         """
-        end = start
-        while end < len(data):
-            if data[end] == 0x00:
-                break
-            end += 1
+        # Find null terminator (bytes.find() scans in C); unterminated strings run to the end
+        end = data.find(b'\x00', start)
+        if end < 0:
+            end = max(len(data), start)
 
         raw_bytes = data[start:end]
         try:
@@ -863,8 +1120,7 @@ class STCM2LDecompiler:
             return entries
 
         # Read header
-        entry_count = struct.unpack('<I', self.data[0:4])[0]
-        entry_type_header = struct.unpack('<I', self.data[4:8])[0]
+        entry_count, entry_type_header = _DIALOGUE_FILE_HEADER.unpack_from(self.data, 0)
 
         # Detect format type
         is_choice_format = (entry_type_header == 8)
@@ -884,36 +1140,31 @@ class STCM2LDecompiler:
         max_entries = entry_count
 
         # First, find all potential entry headers
+        # Look for pattern: byte1=0x00, byte3=0x00
+        # This indicates potential type (2 bytes) + index (2 bytes) structure
+        # The regex scan runs in C and yields only offsets that already have a small
+        # non-zero type and index, instead of testing every byte in Python
         entry_offsets = []
-        for i in range(len(self.data) - 12):
-            # Look for pattern: byte1=0x00, byte3=0x00
-            # This indicates potential type (2 bytes) + index (2 bytes) structure
-            if i + 4 >= len(self.data):
+        speaker_prefixes = self._DIALOGUE_SPEAKER_PREFIXES
+        scan_end = len(self.data) - 12
+        for match in self._DIALOGUE_HEADER_RE.finditer(self.data):
+            i = match.start()
+            if i >= scan_end:
                 break
-            if self.data[i + 1] == 0x00 and self.data[i + 3] == 0x00:
-                # Check if this looks like a valid entry header
-                entry_type = struct.unpack('<H', self.data[i:i+2])[0]
-                entry_index = struct.unpack('<H', self.data[i+2:i+4])[0]
-                # Valid types seem to be small positive integers
-                if 1 <= entry_type <= 100 and 1 <= entry_index <= max_entries:
-                    # Check if followed by 'yougo' speaker name pattern
-                    if i + 9 < len(self.data):
-                        # Check for common speaker prefixes
-                        speaker_prefix = self.data[i+4:i+9]
-                        # Common prefixes: 'yougo', 'her01', etc.
-                        if (speaker_prefix == b'yougo' or
-                            speaker_prefix == b'her01' or
-                            speaker_prefix == b'zara0' or
-                            speaker_prefix == b'ness0' or
-                            speaker_prefix == b'pear0' or
-                            speaker_prefix == b'rich0' or
-                            speaker_prefix == b'rath0' or
-                            speaker_prefix == b'elza0' or
-                            speaker_prefix == b'tiara'):
-                            entry_offsets.append(i)
-
-        # Remove duplicates and sort
-        entry_offsets = sorted(set(entry_offsets))
+            # Check if this looks like a valid entry header
+            entry_type, entry_index = _DIALOGUE_ENTRY_HEADER.unpack_from(self.data, i)
+            # Valid types seem to be small positive integers
+            if 1 <= entry_type <= 100 and 1 <= entry_index <= max_entries:
+                # Check if followed by 'yougo' speaker name pattern
+                if i + 9 < len(self.data):
+                    # Check for common speaker prefixes
+                    if self.data[i+4:i+9] in speaker_prefixes:
+                        entry_offsets.append(i)
+
+        # No dedup/sort needed: finditer() yields each offset once, in increasing order
+
+        find_segments = self._TEXT_SEGMENT_RE.finditer
+        skipped_segments = self._SKIPPED_SEGMENTS
 
         # Parse each entry
         for idx, offset in enumerate(entry_offsets):
@@ -921,8 +1172,7 @@ class STCM2LDecompiler:
                 break
 
             # Read entry header (4 bytes): type (2) + index (2)
-            entry_type = struct.unpack('<H', self.data[offset:offset+2])[0]
-            entry_index = struct.unpack('<H', self.data[offset+2:offset+4])[0]
+            entry_type, entry_index = _DIALOGUE_ENTRY_HEADER.unpack_from(self.data, offset)
 
             # Determine next entry offset (or end of file)
             if idx + 1 < len(entry_offsets):
@@ -943,61 +1193,40 @@ class STCM2LDecompiler:
                 # No null found, check for padding
                 speaker = speaker_data.rstrip(b'\xff').decode('ascii', errors='replace')
                 text_start = speaker_offset + len(speaker) + 1
+            # Speaker prefixes repeat on almost every entry - share one string object per name
+            speaker = sys.intern(speaker)
 
             # Read text data (from text_start to next entry)
             # Find ALL text fields within the entry (entries can have multiple text segments)
             text_segments = []
 
-            search_pos = text_start
-            while search_pos < next_offset:
-                # Skip null/0xFF padding
-                while search_pos < next_offset and self.data[search_pos] in (0x00, 0xFF):
-                    search_pos += 1
-
-                if search_pos >= next_offset:
-                    break
-
-                # Find the start of Japanese text (E3-E9 range) or ASCII text
-                # Look for a continuous text segment until null or padding
-                text_start_local = search_pos
-
-                # Find end of this text segment
-                text_end_local = text_start_local
-                while text_end_local < next_offset:
-                    byte_val = self.data[text_end_local]
-                    if byte_val == 0x00 or byte_val == 0xFF:
-                        break
-                    text_end_local += 1
-
-                # Extract the text segment
-                if text_end_local > text_start_local + 1:
-                    segment_bytes = self.data[text_start_local:text_end_local]
-
-                    # Decode the segment
-                    try:
-                        segment_text = segment_bytes.decode('utf-8', errors='replace')
-                        # Skip bytecode instructions and very short labels
-                        if (len(segment_text) > 2 and
-                            segment_text not in ('memory_init', 'memory_exit', 'COLLECTION_LINK',
-                                              'scene_play', 'suma') and
-                            not segment_text.startswith('@') and
-                            not segment_text.startswith('#')):
-                            text_segments.append(segment_text)
-                    except:
-                        pass
-
-                search_pos = text_end_local + 1
+            # Each match is a continuous text segment (Japanese or ASCII) between null/0xFF padding;
+            # segments shorter than 2 bytes are skipped by the pattern itself
+            for segment_match in find_segments(self.data, text_start, next_offset):
+                segment_bytes = segment_match.group()
+
+                # Decode the segment
+                try:
+                    segment_text = segment_bytes.decode('utf-8', errors='replace')
+                    # Skip bytecode instructions and very short labels
+                    if (len(segment_text) > 2 and
+                        segment_text not in skipped_segments and
+                        not segment_text.startswith(('@', '#'))):
+                        text_segments.append(segment_text)
+                except:
+                    pass
 
             # Combine all text segments, separated by newlines
             # Usually the main dialogue is the longest segment
             if text_segments:
-                # Sort by length (descending) - longest is usually the main dialogue
-                text_segments.sort(key=len, reverse=True)
-                # Use the longest segment as main text
-                text = text_segments[0]
-                # Append other segments as notes if they're meaningful
-                notes = [s for s in text_segments[1:] if len(s) > 5]
+                # Use the longest segment as main text - longest is usually the main dialogue
+                # (max() picks the first of equal-length segments, like the stable sort did)
+                text = max(text_segments, key=len)
+                text_segments.remove(text)
+                # Append other segments as notes if they're meaningful, longest first
+                notes = [s for s in text_segments if len(s) > 5]
                 if notes:
+                    notes.sort(key=len, reverse=True)
                     text += ' [' + ', '.join(notes) + ']'
             else:
                 text = ""
@@ -1030,12 +1259,37 @@ class STCM2LDecompiler:
 
         return offset
 
-    def _parse_padded_format(self) -> List[dict]:
+    def _find_placeholder_text_end(self, text_start: int, min_remaining: int = 0) -> int:
+        """
+        Find the end of a Type 0x10 text (its size field is a placeholder).
+
+        The text ends at the first null byte that is followed by more padding (2+ nulls in
+        the next 4 bytes) and has more than min_remaining bytes after it. Scans at most 500
+        bytes; bytes.find() jumps between null bytes in C.
+        """
+        data = self.data
+        limit = min(len(data), text_start + 500)
+        text_end = data.find(b'\x00', text_start, limit)
+        while text_end >= 0:
+            if text_end + min_remaining < len(data) and data.count(b'\x00', text_end, text_end + 4) >= 2:
+                return text_end
+            text_end = data.find(b'\x00', text_end + 1, limit)
+        return max(limit, text_start)
+
+    def _decode_stripped(self, start: int, end: int) -> str:
+        """Decode self.data[start:end] as UTF-8 without its trailing null padding (one slice, no rstrip copy)."""
+        data = self.data
+        while end > start and data[end - 1] == 0x00:
+            end -= 1
+        return data[start:end].decode('utf-8', errors='replace')
+
+    def _parse_padded_format(self, skip_indices: AbstractSet[int] = frozenset()) -> List[dict]:
         """
         Parse padded format entries (with 4-byte or 8-byte padding prefix).
         Pattern: 00 00 00 00 [00 00 00 00] TT TT TT 00 II II II 00 SS SS SS 00 [string data]
         v1.1.10: Added support for 8-byte padding (some Type 0x0A entries have 8 null bytes)
         NOTE: Scan entire file, not just from CODE_START_
+        Entries whose index is in skip_indices are stepped over without decoding their text.
         """
         entries = []
         # Start from beginning of file, not CODE_START_
@@ -1045,12 +1299,13 @@ class STCM2LDecompiler:
         pos = offset
         entry_count = 0
         type4_count = 0
+        read_header = _FULL_ENTRY_HEADER.unpack_from
         while pos < len(self.data) - 24:
             try:
-                # Check for 4-byte padding (00 00 00 00)
-                if self.data[pos] != 0x00 or self.data[pos+1] != 0x00 or self.data[pos+2] != 0x00 or self.data[pos+3] != 0x00:
-                    pos += 1
-                    continue
+                # Jump to the next 4-byte padding (00 00 00 00) - bytes.find() scans in C
+                pos = self.data.find(b'\x00\x00\x00\x00', pos)
+                if pos < 0 or pos >= len(self.data) - 24:
+                    break
 
                 # v1.1.10: Determine offset - check for 4 or 8 null bytes
                 padding_offset = 4
@@ -1060,18 +1315,12 @@ class STCM2LDecompiler:
                     # 8 null bytes found (some Type 0x0A entries have this padding)
                     padding_offset = 8
 
-                # Read entry type at variable offset
-                entry_type = struct.unpack('<I', self.data[pos+padding_offset:pos+padding_offset+4])[0]
-
-                # Read index (4 bytes after type)
-                entry_index = struct.unpack('<I', self.data[pos+padding_offset+4:pos+padding_offset+8])[0]
-
-                # Read size (4 bytes after index)
-                entry_size = struct.unpack('<I', self.data[pos+padding_offset+8:pos+padding_offset+12])[0]
+                # Read entry type at variable offset, then index and size (4 bytes each)
+                entry_type, entry_index, entry_size = read_header(self.data, pos + padding_offset)
 
                 # Validate entry type (accept 0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x09, 0x0A, 0x0B, 0x0C, 0x0F, 0x10, 0x11, 0x12)
                 # 0x01: Choice options (English) (v1.1.13), 0x02/0x03: Choice options, 0x04: Main dialogue, 0x05/0x06: Dialogue continuation (v1.1.2), 0x07: Dialogue/narration, 0x08: Dialogue continuation (v1.1.10), 0x09: Dialogue (v1.1.11), 0x0A: Dialogue (v1.1.9), 0x0B/0x0C: Questions, 0x0F: Dialogue continuation (v1.1.15), 0x10: Dialogue continuation (v1.1.18), 0x11: Dialogue continuation (v1.1.19), 0x12: Narration
-                if entry_type not in [0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x09, 0x0A, 0x0B, 0x0C, 0x0F, 0x10, 0x11, 0x12]:
+                if entry_type not in self._PADDED_ENTRY_TYPES:
                     pos += 1
                     continue
 
@@ -1079,19 +1328,7 @@ class STCM2LDecompiler:
                 if entry_type == 0x10:
                     # Calculate actual size by finding null terminator
                     text_start = pos + padding_offset + 12
-                    text_end = text_start
-                    while text_end < len(self.data) and text_end - text_start < 500:
-                        if self.data[text_end] == 0x00:
-                            # Check if followed by padding and next entry
-                            null_count = 0
-                            for i in range(4):
-                                if text_end + i < len(self.data) and self.data[text_end + i] == 0x00:
-                                    null_count += 1
-                            if null_count >= 2:
-                                break
-                            text_end += 1
-                        else:
-                            text_end += 1
+                    text_end = self._find_placeholder_text_end(text_start)
                     entry_size = text_end - text_start
                     if entry_size < 1:
                         pos += 1
@@ -1112,9 +1349,12 @@ class STCM2LDecompiler:
                 if string_end > len(self.data):
                     break
 
-                string_data = self.data[pos+padding_offset+12:string_end]
                 # Remove null padding from end
-                text = string_data.rstrip(b'\x00').decode('utf-8', errors='replace')
+                # (indices already covered by the compact parser would be dropped in the merge anyway)
+                if entry_index in skip_indices:
+                    text = ''
+                else:
+                    text = self._decode_stripped(pos + padding_offset + 12, string_end)
 
                 # Only add valid text entries (filter out garbage binary data)
                 if text and self._is_valid_text(text):
@@ -1135,34 +1375,34 @@ class STCM2LDecompiler:
                 # Skip padding bytes to find next entry
                 while pos < len(self.data) - 24:
                     # Check for 4-byte or 8-byte padding + valid type
-                    if (self.data[pos] == 0x00 and self.data[pos+1] == 0x00 and
-                        self.data[pos+2] == 0x00 and self.data[pos+3] == 0x00):
-
-                        # Determine offset for next entry check
-                        check_offset = 4
-                        next_type = struct.unpack('<I', self.data[pos+4:pos+8])[0]
-                        next_size = struct.unpack('<I', self.data[pos+12:pos+16])[0]
-
-                        # v1.1.10: Check for 8-byte padding
-                        if (pos + 8 <= len(self.data) and
-                            self.data[pos+4] == 0x00 and self.data[pos+5] == 0x00 and
-                            self.data[pos+6] == 0x00 and self.data[pos+7] == 0x00):
-                            # Has 8 null bytes, read the actual type at pos+8
-                            check_offset = 8
-                            next_type = struct.unpack('<I', self.data[pos+8:pos+12])[0]
-                            next_size = struct.unpack('<I', self.data[pos+16:pos+20])[0]  # Size at pos+16 with 8-byte padding
-
-                        # v1.1.9: Added 0x06, 0x0A to type list
-                        # v1.1.10: Added 0x08 to type list
-                        # v1.1.11: Added 0x09 to type list
-                        # v1.1.13: Added 0x01 to type list
-                        # v1.1.15: Added 0x0D, 0x0E to type list
-                        # v1.1.18: Added 0x10 to type list
-                        # v1.1.19: Added 0x11 to type list
-                        if next_type in [0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x09, 0x0A, 0x0B, 0x0C, 0x0D, 0x0E, 0x10, 0x11]:
-                            # v1.1.18: Type 0x10 has placeholder size (0x4000), skip size check
-                            if next_type == 0x10 or 1 <= next_size <= 10000:
-                                break
+                    pos = self.data.find(b'\x00\x00\x00\x00', pos)
+                    if pos < 0 or pos >= len(self.data) - 24:
+                        pos = len(self.data)
+                        break
+
+                    # Determine offset for next entry check
+                    check_offset = 4
+                    next_type, _, next_size = read_header(self.data, pos + 4)
+
+                    # v1.1.10: Check for 8-byte padding
+                    if (pos + 8 <= len(self.data) and
+                        self.data[pos+4] == 0x00 and self.data[pos+5] == 0x00 and
+                        self.data[pos+6] == 0x00 and self.data[pos+7] == 0x00):
+                        # Has 8 null bytes, read the actual type at pos+8
+                        check_offset = 8
+                        next_type, _, next_size = read_header(self.data, pos + 8)  # Size at pos+16 with 8-byte padding
+
+                    # v1.1.9: Added 0x06, 0x0A to type list
+                    # v1.1.10: Added 0x08 to type list
+                    # v1.1.11: Added 0x09 to type list
+                    # v1.1.13: Added 0x01 to type list
+                    # v1.1.15: Added 0x0D, 0x0E to type list
+                    # v1.1.18: Added 0x10 to type list
+                    # v1.1.19: Added 0x11 to type list
+                    if next_type in self._PADDED_NEXT_ENTRY_TYPES:
+                        # v1.1.18: Type 0x10 has placeholder size (0x4000), skip size check
+                        if next_type == 0x10 or 1 <= next_size <= 10000:
+                            break
                     pos += 1
 
             except Exception as e:
@@ -1186,11 +1426,12 @@ class STCM2LDecompiler:
         offset = 0
 
         pos = offset
+        read_header = _FULL_ENTRY_HEADER.unpack_from
         # v1.1.13: Fixed to allow processing entries at file end boundary (pos <= len(data) - 12)
         while pos + 12 <= len(self.data):
             try:
-                # Read entry type (little-endian uint32)
-                entry_type = struct.unpack('<I', self.data[pos:pos+4])[0]
+                # Read entry type, index (bytes 4-7) and size (bytes 8-11) (little-endian uint32)
+                entry_type, entry_index, entry_size = read_header(self.data, pos)
 
                 # Valid entry types are 0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x0A, 0x0B, 0x0C, 0x0D, 0x0E, 0x0F, 0x10, 0x11, 0x12
                 # 0x01: Choice options (English) (v1.1.13)
@@ -1201,44 +1442,25 @@ class STCM2LDecompiler:
                 # 0x0F is dialogue continuation (v1.1.15)
                 # 0x10 is dialogue continuation (v1.1.18) - size field is placeholder (0x4000), not actual size
                 # 0x11 is dialogue continuation (v1.1.19)
-                if entry_type not in [0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x09, 0x0A, 0x0B, 0x0C, 0x0D, 0x0E, 0x0F, 0x10, 0x11, 0x12]:
-                    pos += 1
+                if entry_type not in self._COMPACT_ENTRY_TYPES:
+                    # Jump to the next position holding a valid type instead of stepping one byte at a time
+                    match = self._COMPACT_TYPE_RE.search(self.data, pos + 1)
+                    pos = match.start() if match else len(self.data)
                     continue
 
-                # Read index (bytes 4-7)
-                entry_index = struct.unpack('<I', self.data[pos+4:pos+8])[0]
-
                 # Validate index (reasonable range)
                 if entry_index > 100000:
                     pos += 1
                     continue
 
-                # Read size (bytes 8-11)
-                entry_size = struct.unpack('<I', self.data[pos+8:pos+12])[0]
-
                 # v1.1.18: Type 0x10 has a placeholder size (0x4000), not actual text size
                 # Calculate actual size by finding null terminator or next entry
                 if entry_type == 0x10:
                     # Skip the placeholder size and find actual text length
                     text_start = pos + 12
                     # Find null terminator or max 500 bytes
-                    text_end = text_start
-                    while text_end < len(self.data) and text_end - text_start < 500:
-                        if self.data[text_end] == 0x00:
-                            # Check if this is followed by more nulls (padding) and then a new entry
-                            if text_end + 12 < len(self.data):
-                                next_bytes = self.data[text_end:text_end+12]
-                                # Valid entry header pattern: type not in valid range, check for structure
-                                # Next entry starts with 4 null bytes, then type
-                                null_count = 0
-                                for i in range(4):
-                                    if text_end + i < len(self.data) and self.data[text_end + i] == 0x00:
-                                        null_count += 1
-                                if null_count >= 2:
-                                    break
-                            text_end += 1
-                        else:
-                            text_end += 1
+                    # Only counts if a full 12-byte entry header could still follow
+                    text_end = self._find_placeholder_text_end(text_start, 12)
                     entry_size = text_end - text_start
                     if entry_size < 1:
                         pos += 1
@@ -1255,8 +1477,7 @@ class STCM2LDecompiler:
                 if string_end > len(self.data):
                     break
 
-                string_data = self.data[pos+12:string_end]
-                text = string_data.rstrip(b'\x00').decode('utf-8', errors='replace')
+                text = self._decode_stripped(pos + 12, string_end)
 
                 if text and self._is_valid_text(text):
                     entries.append({
@@ -1268,9 +1489,10 @@ class STCM2LDecompiler:
                     })
 
                 pos = string_end
-                # Skip padding
-                while pos < len(self.data) - 16 and self.data[pos] == 0x00:
-                    pos += 1
+                # Skip padding (one regex match instead of a per-byte loop)
+                padding_limit = len(self.data) - 16
+                if pos < padding_limit:
+                    pos = self._NULL_RUN_RE.match(self.data, pos, padding_limit).end()
 
             except Exception as e:
                 pos += 1
@@ -1294,9 +1516,9 @@ class STCM2LDecompiler:
                 # Look for start of UTF-8 string (E3-E9 for Japanese, or ASCII)
                 byte_val = self.data[pos]
 
-                # Skip null bytes and padding
+                # Skip the whole run of null bytes and padding at once
                 if byte_val == 0x00 or byte_val == 0xFF:
-                    pos += 1
+                    pos = self._PADDING_RUN_RE.match(self.data, pos).end()
                     continue
 
                 # Try to decode a UTF-8 string starting at this position
@@ -1323,7 +1545,8 @@ class STCM2LDecompiler:
 
     def _is_valid_text(self, text: str) -> bool:
         """Check if text contains valid content (not just binary garbage or bytecode)."""
-        if not text or len(text.strip()) < 2:
+        text_stripped = text.strip()
+        if len(text_stripped) < 2:
             return False
 
         # Check for Unicode replacement characters (indicates invalid UTF-8)
@@ -1332,7 +1555,7 @@ class STCM2LDecompiler:
             return False
 
         # Check for control characters (except common ones like \n)
-        control_count = sum(1 for c in text if ord(c) < 32 and c not in '\n\r\t')
+        control_count = len(text) - len(text.translate(self._CONTROL_CHARS_DELETE))
         if control_count > len(text) / 4:  # More than 25% control chars
             return False
 
@@ -1346,51 +1569,29 @@ class STCM2LDecompiler:
         if len(text) > 10 and at_count > len(text) / 10:  # Much lower threshold: 10%
             return False
 
-        # Check for bytecode/variable patterns (using word boundaries to avoid partial matches)
-        import re
-        bytecode_patterns = [
-            r'\bRelease_', r'\bRute_count_', r'\bFav[A-Z]', r'\bLH_sel_', r'\bsure\d+',  # v1.1.20: Fixed to require digit after 'sure'
-            r'\bsuma\b', r'\bmemory_', r'\bCOLLECTION_LINK', r'\bEXPORT_DATA', r'\bswitch',
-            r'\bscene_play', r'\brathL', r'\belzaL', r'\bzara0', r'\bness0', r'\bher\d+',
-            r'\bzk\d+', r'\bbg\d+',  # Bytecode variable patterns
-            r'\b[A-Z][a-z]+_(bad|good)_end\b',  # Rath_bad_end, Arles_good_end, etc.
-            r'\bTrueEnd\b',  # Route endings
-            r'^[A-Z][a-z]+_[A-Za-z_]+$',  # Pattern like "Bad_PandR", "FavPearl" (full match)
-            # Effect codes and UI elements (v1.0.3)
-            r'\bef_[a-z0-9_]+\b',  # Effect codes (ef_shake5, ef_flash, etc.)
-            r'\bselect\b',  # UI button text
-            r'\bexport_data\b',  # Export markers (case insensitive)
-            # Character variable patterns (v1.1.2)
-            r'^[a-z]+\d+[a-z]*_[a-z]+$',  # raths01ht_kana, mejo07_kamae (lowercase+digits+optional letters+underscore)
-            r'^[a-z]+\d+$',  # mejo07, rath02, etc. (lowercase with numbers, without underscore)
-            r'^[a-z]{3,5}$',  # Short bytecode identifiers (cck, suma, etc.)
-        ]
-        text_stripped = text.strip()
-
         # Special case: Speaker names should always pass through (v1.1.2)
         # These are Type 0x02 entries that pair with dialogue entries
-        if self.is_speaker_name(text_stripped):
+        # Longer text can only match if is_speaker_name() strips null padding off it
+        if ((len(text_stripped) <= self._SPEAKER_NAME_MAX_LEN or '\x00' in text_stripped)
+                and self.is_speaker_name(text_stripped)):
             return True
 
         # v1.1.13: Known English UI choice words should pass through (from Type 0x01 entries)
         # These would otherwise be filtered out by the bytecode pattern check
-        ENGLISH_CHOICE_WORDS = {'yes', 'no', 'ok', 'cancel', 'accept', 'decline', 'close'}
-        if text_stripped.lower() in ENGLISH_CHOICE_WORDS:
+        if text_stripped.lower() in self._ENGLISH_CHOICE_WORDS:
             return True
 
-        for pattern in bytecode_patterns:
-            if re.search(pattern, text_stripped, re.IGNORECASE):
-                # Only allow if it also has substantial Japanese content
-                has_japanese = any(0x3040 <= ord(c) <= 0x9FFF for c in text)
-                if not has_japanese:
-                    return False
-
         # Check for meaningful content (Japanese, ASCII, or mixed)
-        has_japanese = any(0x3040 <= ord(c) <= 0x9FFF for c in text)
+        # Japanese content is allowed even alongside bytecode/variable patterns
+        if self._KANA_KANJI_RE.search(text):
+            return True
+
         # v1.1.13: Changed from > 2 to >= 2 to allow "No" and other short English choice words
-        has_english = sum(1 for c in text if c.isalpha()) >= 2
+        if not self._has_alpha_over(text, 1):
+            return False
 
-        return has_japanese or has_english
+        # Check for bytecode/variable patterns (only reached for non-Japanese text)
+        return self._VALID_TEXT_BYTECODE_RE.search(text_stripped) is None
 
     def decompile_full_format(self) -> List[dict]:
         """
@@ -1398,19 +1599,16 @@ class STCM2LDecompiler:
         Uses both padded and compact format parsers, then merges results (v1.1.2).
         """
         # Try both parsers and merge the results
-        padded_entries = self._parse_padded_format()
+        # Compact runs first so the padded pass can skip decoding indices it would drop
         compact_entries = self._parse_compact_format()
+        compact_indices = {entry['index'] for entry in compact_entries}
+        padded_entries = self._parse_padded_format(compact_indices)
 
         # Combine entries, preferring compact format for overlapping indices
         # v1.1.7: Fixed to keep ALL entries, not just last one per index
         # v1.1.20: Fixed to track offsets to handle duplicate indices correctly
-        entries = []
-        compact_indices = set()
-
         # Add all compact entries first (they preserve original types better)
-        for entry in compact_entries:
-            entries.append(entry)
-            compact_indices.add(entry['index'])
+        entries = list(compact_entries)
 
         # Add padded entries that don't overlap with compact entries (by index)
         for entry in padded_entries:
@@ -1418,7 +1616,8 @@ class STCM2LDecompiler:
                 entries.append(entry)
 
         # Sort by index, then by offset to preserve file order for duplicate indices
-        entries.sort(key=lambda e: (e['index'], e.get('offset', 0)))
+        # (both parsers always set 'offset', so a C-level itemgetter key works)
+        entries.sort(key=itemgetter('index', 'offset'))
 
         # Filter out bytecode identifiers and binary garbage
         entries = [e for e in entries if self._is_valid_text(e.get('text', ''))]
@@ -1450,8 +1649,9 @@ class STCM2LDecompiler:
         """Format text for translation readability."""
         # Replace #n with newlines
         text = text.replace('#n', '\n')
-        # Clean up extra whitespace
-        text = re.sub(r'\n+', '\n', text)
+        # Clean up extra whitespace (collapse blank lines; only needed when two newlines touch)
+        if '\n\n' in text:
+            text = '\n'.join(filter(None, text.split('\n')))
         text = text.strip()
         return text
 
@@ -1468,82 +1668,83 @@ class STCM2LDecompiler:
         # Create parent directory if needed
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(f"===================================================================\n")
+        # Collect the whole output first and write it as one encoded bytes object,
+        # so a formatting error can't leave a truncated output file behind
+        parts = []
+        out = parts.append
 
-            # Check if this is a choice dialogue format file
-            is_choice_format = getattr(self, 'is_choice_format', False)
+        out(f"===================================================================\n")
 
-            if is_choice_format:
-                f.write(f"STCM2L Decompiled Script - CHOICE DIALOGUE FORMAT\n")
-            else:
-                f.write(f"STCM2L Decompiled Script\n")
+        # Check if this is a choice dialogue format file
+        is_choice_format = getattr(self, 'is_choice_format', False)
+
+        if is_choice_format:
+            out(f"STCM2L Decompiled Script - CHOICE DIALOGUE FORMAT\n")
+        else:
+            out(f"STCM2L Decompiled Script\n")
 
-            f.write(f"Source: {self.filename}\n")
-            f.write(f"===================================================================\n\n")
+        out(f"Source: {self.filename}\n")
+        out(f"===================================================================\n\n")
 
-            # Add format-specific notes for choice dialogue
-            if is_choice_format:
-                f.write(f"NOTE: This file contains dialogue choices with voice/emotion variants.\n")
-                f.write(f"Type 80 = Main dialogue choices\n")
-                f.write(f"Type 82 = Alternative/short responses\n")
-                f.write(f"Entries reference scene/event IDs (e.g., 64) rather than sequential numbers.\n")
-                f.write(f"\n")
+        # Add format-specific notes for choice dialogue
+        if is_choice_format:
+            out(f"NOTE: This file contains dialogue choices with voice/emotion variants.\n")
+            out(f"Type 80 = Main dialogue choices\n")
+            out(f"Type 82 = Alternative/short responses\n")
+            out(f"Entries reference scene/event IDs (e.g., 64) rather than sequential numbers.\n")
+            out(f"\n")
 
-            if not self.entries:
-                f.write("[No entries found]\n")
-                return
+        if not self.entries:
+            out("[No entries found]\n")
+        else:
+            # Bind loop invariants and methods once
+            format_text = self.format_text
+            # For choice format files, use sequential numbers instead of the reference ID
+            # v1.1.4: Other files also use sequential display indices instead of the binary Index field
+            display_counter = self._entry_counter if is_choice_format else self._display_index
 
             for entry in self.entries:
-                speaker = entry.get('speaker', '')
-                text = entry.get('text', '')
-                entry_type = entry.get('type', 0)
-                index = entry.get('index', 0)
-                combined_from = entry.get('combined_from')
-
-                # For choice format files, use sequential numbers instead of the reference ID
-                # For other files, use the actual index from the binary
-                is_choice_format = getattr(self, 'is_choice_format', False)
-                is_choice = entry.get('is_choice', False)
+                entry_get = entry.get
+                speaker = entry_get('speaker', '')
+                text = entry_get('text', '')
+                entry_type = entry_get('type', 0)
+                index = entry_get('index', 0)
+                combined_from = entry_get('combined_from')
+
+                is_choice = entry_get('is_choice', False)
                 choice_tag = " [CHOICE]" if is_choice else ""
+                display_index = next(display_counter)
 
                 if is_choice_format:
-                    # Use a sequential counter for display
-                    if not hasattr(self, '_entry_counter'):
-                        self._entry_counter = 1
-                    display_index = self._entry_counter
-                    self._entry_counter += 1
-
                     # Show both sequential and reference ID
                     ref_id = f", RefID: {index}" if index != 64 else ""
-                    f.write(f"--- Entry {display_index} (Type: {entry_type}{ref_id}){choice_tag} ---\n")
+                    out(f"--- Entry {display_index} (Type: {entry_type}{ref_id}){choice_tag} ---\n")
                 else:
-                    # v1.1.4: Use sequential display indices instead of binary Index field
                     # Most binary entries have Index=1, which is not useful for display
-                    if not hasattr(self, '_display_index'):
-                        self._display_index = 1
-                    display_index = self._display_index
-                    self._display_index += 1
-                    f.write(f"--- Entry {display_index} (Type: {entry_type}){choice_tag} ---\n")
+                    out(f"--- Entry {display_index} (Type: {entry_type}){choice_tag} ---\n")
 
                 # Show choice options count
-                if is_choice and entry.get('choice_count', 0) > 1:
-                    options = ' / '.join(entry.get('choice_options', []))
-                    f.write(f"[{entry.get('choice_count')} options: {options}]\n")
+                if is_choice and entry_get('choice_count', 0) > 1:
+                    options = ' / '.join(entry_get('choice_options', []))
+                    out(f"[{entry_get('choice_count')} options: {options}]\n")
 
                 if speaker:
-                    f.write(f"Speaker: {speaker}\n")
+                    out(f"Speaker: {speaker}\n")
 
-                formatted_text = self.format_text(text)
+                formatted_text = format_text(text)
                 if formatted_text:
-                    f.write(f"Text:\n{formatted_text}\n")
+                    out(f"Text:\n{formatted_text}\n")
 
                 if combined_from:
-                    f.write(f"[Combined from entries {combined_from}]\n")
+                    out(f"[Combined from entries {combined_from}]\n")
+
+                out("\n")
 
-                f.write("\n")
+        with open(output_path, 'wb') as f:
+            f.write(_encode_output(parts))
 
-        print(f"  Wrote {len(self.entries)} entries to {output_path}", file=sys.stderr)
+        if self.entries:
+            print(f"  Wrote {len(self.entries)} entries to {output_path}", file=sys.stderr)
 
 
 def decompile_file(input_path: str, output_dir: str) -> bool:
@@ -1565,6 +1766,16 @@ def decompile_file(input_path: str, output_dir: str) -> bool:
     return len(entries) > 0
 
 
+def _decompile_one(args: Tuple[str, str]) -> bool:
+    """Process-pool worker for decompile_directory(): decompile one file, reporting errors."""
+    input_path, output_dir = args
+    try:
+        return decompile_file(input_path, output_dir)
+    except Exception as e:
+        print(f"Error processing {os.path.basename(input_path)}: {e}", file=sys.stderr)
+        return False
+
+
 def decompile_directory(input_dir: str, output_dir: str):
     """Decompile all STCM2L files in a directory."""
     input_path = Path(input_dir)
@@ -1573,21 +1784,28 @@ def decompile_directory(input_dir: str, output_dir: str):
     # Create output directory
     output_path.mkdir(parents=True, exist_ok=True)
 
-    # Find all STCM2L files (files in SCRIPT folder are binary data)
-    files = sorted(input_path.glob('*'), key=lambda p: p.name)
-
-    # Filter out non-file entries
-    files = [f for f in files if f.is_file()]
+    # Find all STCM2L files (files in SCRIPT folder are binary data), skipping non-file entries
+    files = sorted((f for f in input_path.iterdir() if f.is_file()), key=attrgetter('name'))
 
     print(f"Found {len(files)} files to decompile...", file=sys.stderr)
 
-    success_count = 0
-    for file in files:
+    # Files are independent, so decompile them in parallel across CPU cores
+    jobs = [(str(file), str(output_path)) for file in files]
+    executor = None
+    if len(jobs) > 1:
         try:
-            if decompile_file(str(file), str(output_path)):
-                success_count += 1
-        except Exception as e:
-            print(f"Error processing {file.name}: {e}", file=sys.stderr)
+            executor = ProcessPoolExecutor()
+        except (ImportError, NotImplementedError, OSError):
+            # No working multiprocessing on this platform (e.g. no semaphore support)
+            executor = None
+
+    if executor is not None:
+        chunksize = max(1, len(jobs) // (4 * (os.cpu_count() or 1)))
+        with executor:
+            success_count = sum(executor.map(_decompile_one, jobs, chunksize=chunksize))
+    else:
+        # Zero or one file isn't worth the process startup cost; also the fallback without a pool
+        success_count = sum(map(_decompile_one, jobs))
 
     print(f"\nDecompilation complete: {success_count}/{len(files)} files processed", file=sys.stderr)
 